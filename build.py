@@ -1,6 +1,8 @@
 import os
 import platform
 import shutil
+import multiprocessing
+import PyInstaller.__main__ as pyi
 
 def clean_directories():
     """Clean build and dist directories"""
@@ -9,6 +11,10 @@ def clean_directories():
         if os.path.exists(dir_name):
             shutil.rmtree(dir_name)
 
+def build_one(name, script):
+    """Build a single one-file executable with PyInstaller in this process"""
+    pyi.run(['--onefile', '--name', name, script])
+
 def build_executables():
     """Build executables for client and server"""
     # Clean previous builds
@@ -17,15 +23,23 @@ def build_executables():
     # Determine the appropriate file extension
     ext = '.exe' if platform.system() == 'Windows' else ''
     
-    # Build commands
-    commands = [
-        f'pyinstaller --onefile --name remote_server{ext} server.py',
-        f'pyinstaller --onefile --name remote_client{ext} client.py'
+    # Build targets; they write to different names so they can build side by side
+    targets = [
+        (f'remote_server{ext}', 'server.py'),
+        (f'remote_client{ext}', 'client.py')
     ]
     
-    # Execute build commands
-    for cmd in commands:
-        os.system(cmd)
+    # Run the builds in parallel, each in its own process
+    builds = [multiprocessing.Process(target=build_one, args=target) for target in targets]
+    for build in builds:
+        build.start()
+    for build in builds:
+        build.join()
+    
+    failed = [name for (name, _), build in zip(targets, builds) if build.exitcode != 0]
+    if failed:
+        print(f"\nBuild failed for: {', '.join(failed)}")
+        return
     
     print("\nBuild completed!")
     print(f"\nExecutables can be found in the 'dist' directory:")
@@ -1,8 +1,10 @@
 import socket
 import logging
 import sys
-import json
-from tabulate import tabulate
+import os
+import selectors
+from collections import deque
+import orjson
 import argparse
 
 # Configure logging
@@ -11,6 +13,22 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Responses carry indented JSON, so size the receive buffer generously;
+# it still grows if a larger response arrives
+RECV_BUFFER_SIZE = 65536
+# Messages in both directions are prefixed with their length as a little-endian uint32
+HEADER_SIZE = 4
+# Seconds to wait for the server before giving up on a connect or response
+SOCKET_TIMEOUT = 30
+# Kernel receive buffer size requested for the connection
+SOCKET_BUFFER_SIZE = 1 << 17
+# Seconds of idle time before keepalive probes start, and between probes
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+# Multipliers for turning the server's raw byte counts into display units
+GB = 1.0 / 1073741824.0
+MB = 1.0 / 1048576.0
+
 class RemoteClient:
     """
     A client for connecting to the remote monitoring server and executing commands.
@@ -22,12 +40,17 @@ class RemoteClient:
         host (str): The server host to connect to (default: '127.0.0.1')
         port (int): The server port to connect to (default: 65432)
         socket (socket.socket): The client socket object
+        recv_buf (bytearray): Reusable buffer that server responses are received into
     
     Example:
         >>> client = RemoteClient(host='server_ip', port=65432)
         >>> client.start_client()
     """
     
+    # The process table always has the same three columns, so its layout is fixed
+    _PROC_TMPL = '{:>7} {:<24} {:>8}\n'
+    _PROC_HDR = _PROC_TMPL.format('PID', 'Name', 'Memory %') + '-' * 41 + '\n'
+    
     def __init__(self, host='127.0.0.1', port=65432):
         """
         Initialize the RemoteClient with server host and port.
@@ -39,11 +62,25 @@ class RemoteClient:
         self.host = host
         self.port = port
         self.socket = None
+        # Responses are read into one buffer that lives as long as the client
+        self.recv_buf = bytearray(RECV_BUFFER_SIZE)
+        self.recv_mv = memoryview(self.recv_buf)
         
     def connect(self):
         """Connect to the remote server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Commands are tiny; send them immediately instead of waiting on Nagle
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Detect a vanished server while sitting at the prompt
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+            # Must be set before connect() so the advertised window can use it
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            # Don't hang forever on a stalled or dead server
+            self.socket.settimeout(SOCKET_TIMEOUT)
             self.socket.connect((self.host, self.port))
             logging.info(f"Connected to server at {self.host}:{self.port}")
             return True
@@ -54,13 +91,40 @@ class RemoteClient:
     def send_command(self, command):
         """Send command to server and receive response"""
         try:
-            self.socket.send(command.encode())
-            response = self.socket.recv(4096).decode()
-            return response
+            self._send_frame(command)
+            return self._recv_frame()
+        except (socket.timeout, ConnectionError) as e:
+            # A late or partial response would desync the framing; drop the connection
+            logging.error(f"Connection to server lost: {str(e) or 'timed out'}")
+            self.cleanup()
+            return None
         except Exception as e:
             logging.error(f"Error sending command: {str(e)}")
             return None
 
+    def _send_frame(self, command):
+        """Send a single length-prefixed command"""
+        payload = command.encode()
+        self.socket.sendall(len(payload).to_bytes(HEADER_SIZE, 'little') + payload)
+
+    def _recv_frame(self):
+        """Read a single length-prefixed message from the server"""
+        length = int.from_bytes(self._recv_exact(HEADER_SIZE), 'little')
+        return str(self._recv_exact(length), 'utf-8')
+
+    def _recv_exact(self, n):
+        """Read exactly n bytes from the server into the receive buffer"""
+        if n > len(self.recv_buf):
+            self.recv_buf = bytearray(n)
+            self.recv_mv = memoryview(self.recv_buf)
+        got = 0
+        while got < n:
+            received = self.socket.recv_into(self.recv_mv[got:n], n - got)
+            if not received:
+                raise ConnectionError("Server closed the connection")
+            got += received
+        return self.recv_mv[:n]
+
     def start_client(self):
         """Start client interface"""
         if not self.connect():
@@ -69,53 +133,181 @@ class RemoteClient:
         self.show_help()
         
         try:
-            while True:
-                command = input("\nEnter command: ").strip()
-                if not command:
-                    continue
-
-                response = self.send_command(command)
-                if response:
-                    self.format_response(command, response)
-                
-                if command.lower() == 'exit':
-                    break
+            if sys.platform == 'win32':
+                # select() on Windows only accepts sockets, not the console
+                self._run_lockstep()
+            else:
+                self._run_multiplexed()
 
         except KeyboardInterrupt:
             print("\nClient shutting down...")
         finally:
             self.cleanup()
 
+    def _prompt(self):
+        """Show the command prompt"""
+        print("\nEnter command: ", end='', flush=True)
+
+    def _run_lockstep(self):
+        """Read a command, wait for its response, repeat"""
+        while True:
+            try:
+                command = input("\nEnter command: ").strip()
+            except EOFError:
+                break
+            if not command:
+                continue
+
+            response = self.send_command(command)
+            if response:
+                self.format_response(command, response)
+            
+            if self.socket is None or command.lower() == 'exit':
+                break
+
+    def _run_multiplexed(self):
+        """Wait on stdin and the server together, so messages the server pushes show up right away"""
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(sys.stdin, selectors.EVENT_READ, 'in')
+        except (PermissionError, ValueError):
+            # epoll refuses regular files such as '< commands.txt' or '< /dev/null';
+            # they are always readable anyway, so plain lock-step reads suffice
+            sel.close()
+            self._run_lockstep()
+            return
+        sel.register(self.socket, selectors.EVENT_READ, 'net')
+        # Commands sent but not answered yet, oldest first; responses arrive in order
+        pending = deque()
+        stdin_buf = b''
+        stdin_open = True
+        self._prompt()
+        try:
+            while True:
+                for key, _ in sel.select():
+                    if key.data == 'in':
+                        # Read the fd directly; a buffered readline() could hide queued lines from select()
+                        chunk = os.read(sys.stdin.fileno(), 4096)
+                        if not chunk:
+                            # End of input: send a final line that had no newline, stop
+                            # reading stdin, but collect outstanding responses
+                            command = stdin_buf.decode(errors='replace').strip()
+                            stdin_buf = b''
+                            if command:
+                                self._send_frame(command)
+                                pending.append(command)
+                            sel.unregister(sys.stdin)
+                            stdin_open = False
+                            if not pending:
+                                return
+                            continue
+                        stdin_buf += chunk
+                        *lines, stdin_buf = stdin_buf.split(b'\n')
+                        for line in lines:
+                            command = line.decode(errors='replace').strip()
+                            if command:
+                                self._send_frame(command)
+                                pending.append(command)
+                    else:
+                        response = self._recv_frame()
+                        # Anything arriving with no command outstanding was pushed by the server
+                        command = pending.popleft() if pending else ''
+                        self.format_response(command, response)
+                        if command.lower() == 'exit' or (not pending and not stdin_open):
+                            return
+                    if not pending:
+                        self._prompt()
+        except (socket.timeout, ConnectionError) as e:
+            logging.error(f"Connection to server lost: {str(e) or 'timed out'}")
+        finally:
+            sel.close()
+
     def format_response(self, command, response):
         """Format the response based on command type"""
         print("\nServer response:")
         
+        printer = self._FORMATTERS.get(command.split(' ', 1)[0].lower())
+        if printer is None:
+            # Plain-text command
+            print(response)
+            return
+        
         try:
-            # Try to parse response as JSON
-            data = json.loads(response)
-            
-            if command.startswith('processes'):
-                # Format process list as table
-                headers = ['PID', 'Name', 'Memory %']
-                rows = [[p['pid'], p['name'], f"{p.get('memory_percent', 0):.1f}%"] 
-                       for p in data]
-                print(tabulate(rows, headers=headers, tablefmt='grid'))
-                
-            elif command.startswith(('cpu', 'memory', 'netstat', 'diskspace')):
-                # Pretty print JSON data
-                print(json.dumps(data, indent=2))
-                
-            elif command.startswith('listdir'):
-                # Format directory listing
-                print(f"\nContents of {data['path']}:")
-                for item in data['contents']:
-                    print(f"  {item}")
-            else:
-                print(response)
-                
-        except json.JSONDecodeError:
-            # If not JSON, print as plain text
+            data = orjson.loads(response)
+        except orjson.JSONDecodeError:
+            # Errors such as "Access denied" come back as plain text
             print(response)
+            return
+        printer(self, data)
+
+    def _print_processes(self, data):
+        """Format process list as table"""
+        tmpl = self._PROC_TMPL
+        print(''.join([self._PROC_HDR] +
+                      [tmpl.format(p['pid'], (p['name'] or '')[:24],
+                                   f"{p.get('memory_percent') or 0:.1f}%")
+                       for p in data]), end='')
+
+    def _print_json(self, data):
+        """Pretty print JSON data"""
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+
+    def _print_memory(self, data):
+        """Pretty print memory statistics; the server sends raw byte counts"""
+        self._print_json(self.format_memory(data))
+
+    def _print_network(self, data):
+        """Pretty print network counters in MB"""
+        self._print_json(self.format_network(data))
+
+    def _print_disk_space(self, data):
+        """Pretty print per-partition usage in GB"""
+        self._print_json({mount: self.format_disk_usage(usage)
+                          for mount, usage in data.items()})
+
+    def _print_listdir(self, data):
+        """Format directory listing"""
+        print(f"\nContents of {data['path']}:")
+        for item in data['contents']:
+            print(f"  {item}")
+
+    # Printer for each command that returns JSON, keyed by the command word
+    _FORMATTERS = {
+        'processes': _print_processes,
+        'cpu': _print_json,
+        'memory': _print_memory,
+        'netstat': _print_network,
+        'diskspace': _print_disk_space,
+        'listdir': _print_listdir,
+    }
+
+    def format_memory(self, data):
+        """Convert raw memory statistics to display units"""
+        return {
+            'total': f"{data['total'] * GB:.2f} GB",
+            'available': f"{data['available'] * GB:.2f} GB",
+            'percent_used': f"{data['percent_used']}%",
+            'swap_total': f"{data['swap_total'] * GB:.2f} GB",
+            'swap_used': f"{data['swap_used'] * GB:.2f} GB"
+        }
+
+    def format_network(self, data):
+        """Convert raw network counters to display units"""
+        return {
+            'bytes_sent': f"{data['bytes_sent'] * MB:.2f} MB",
+            'bytes_recv': f"{data['bytes_recv'] * MB:.2f} MB",
+            'packets_sent': data['packets_sent'],
+            'packets_recv': data['packets_recv']
+        }
+
+    def format_disk_usage(self, usage):
+        """Convert raw usage of a single partition to display units"""
+        return {
+            'total': f"{usage['total'] * GB:.2f} GB",
+            'used': f"{usage['used'] * GB:.2f} GB",
+            'free': f"{usage['free'] * GB:.2f} GB",
+            'percent': f"{usage['percent']}%"
+        }
 
     def show_help(self):
         """Show available commands"""
@@ -148,6 +340,7 @@ Other:
         """Clean up client resources"""
         if self.socket:
             self.socket.close()
+            self.socket = None
         logging.info("Client cleaned up and shut down")
 
 def parse_arguments():
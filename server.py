@@ -1,13 +1,20 @@
 import socket
-import platform
 import subprocess
 import sys
-from datetime import datetime
 import logging
 import os
-import psutil
-import json
+import orjson
 import argparse
+import heapq
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -15,19 +22,36 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Largest command accepted from a client; longer ones close the connection
+MAX_COMMAND_SIZE = 4096
+# Messages in both directions are prefixed with their length as a little-endian uint32
+HEADER_SIZE = 4
+# Kernel send/receive buffer size requested for client connections
+SOCKET_BUFFER_SIZE = 1 << 17
+# Seconds of idle time before keepalive probes start, and between probes
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+# Pending connections the kernel queues before they are accepted
+LISTEN_BACKLOG = 128
+# Seconds between background samples of CPU, memory and network counters
+SAMPLE_INTERVAL = 0.5
+# Cached responses smaller than this are copied into one header+payload write;
+# below it, saving the copy isn't worth a separate header write and TCP segment
+SENDFILE_MIN_SIZE = 4096
+
 class RemoteServer:
     """
     A secure remote monitoring server that provides system information and monitoring capabilities.
     
     This server implements various monitoring commands and restricts operations to maintain security.
     It uses socket programming for network communication and includes comprehensive logging.
+    Clients are served concurrently on an asyncio event loop (uvloop when it is installed).
     
     Attributes:
         host (str): The host address to bind to (default: '127.0.0.1')
         port (int): The port to listen on (default: 65432)
+        reuse_port (bool): Whether SO_REUSEPORT is set on the listening socket (default: False)
         socket (socket.socket): The server socket object
-        client (socket.socket): The connected client socket
-        addr (tuple): The address info of the connected client
         allowed_dirs (list): List of directories allowed for file operations
     
     Example:
@@ -35,59 +59,214 @@ class RemoteServer:
         >>> server.start_server()
     """
     
-    def __init__(self, host='127.0.0.1', port=65432):
+    # Commands cheap enough to answer directly on the event loop
+    _INLINE_COMMANDS = frozenset({b'sysinfo', b'time', b'echo', b'exit',
+                                  b'cpu', b'memory', b'netstat'})
+    # Commands that need psutil loaded and the first metric samples taken
+    _METRIC_COMMANDS = frozenset({b'cpu', b'memory', b'netstat', b'processes', b'diskspace'})
+    
+    def __init__(self, host='127.0.0.1', port=65432, reuse_port=False):
         """
         Initialize the RemoteServer with host and port.
         
         Args:
             host (str): The host address to bind to
             port (int): The port to listen on
+            reuse_port (bool): Share the port with other server processes via SO_REUSEPORT
         """
         self.host = host
         self.port = port
+        self.reuse_port = reuse_port
         self.socket = None
-        self.client = None
-        self.addr = None
         # Define allowed directories for file operations
         self.allowed_dirs = ['./shared', './downloads']
         self.setup_directories()
+        # Extended dictionary of allowed commands, keyed by the raw command word
+        self._commands = {
+            b'sysinfo': self.get_system_info,
+            b'time': self.get_time,
+            b'echo': self.echo_message,
+            b'exit': self.exit_connection,
+            b'cpu': self.get_cpu_info,
+            b'memory': self.get_memory_info,
+            b'processes': self.get_running_processes,
+            b'netstat': self.get_network_stats,
+            b'listdir': self.list_directory,
+            b'diskspace': self.get_disk_space
+        }
+        # psutil and platform are slow to import, so everything derived from them is
+        # filled in lazily, in the executor: static values and metric samples on the
+        # first metric request, the sysinfo reply on the first sysinfo request
+        self._cpu_count_phys = None
+        self._cpu_count_log = None
+        self._cpu_freq_static = {}
+        self._partitions = []
+        self._page_percent = None
+        self._sysinfo_bytes = None
+        self._sysinfo_fd = None
+        self._last_cpu = []
+        self._last_cpu_freq = None
+        self._last_memory = None
+        self._last_swap = None
+        self._last_net = None
+        self._sampler = None
+        # Lazy initializers that are running or done, shared by concurrent first requests
+        self._init_futures = {}
+        # Worker threads for blocking calls that can overlap, e.g. statvfs per mountpoint
+        self._pool = ThreadPoolExecutor(max_workers=4)
         
     def setup_directories(self):
         """Create necessary directories if they don't exist"""
         for directory in self.allowed_dirs:
             os.makedirs(directory, exist_ok=True)
+        # Canonical prefixes with a trailing separator, so './shared_x' can't match './shared'
+        self._allowed_prefixes = tuple(os.path.abspath(d) + os.sep for d in self.allowed_dirs)
 
     def start_server(self):
-        """Start the server and listen for connections"""
+        """Start the server and serve connections until interrupted"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            # Enable address reuse
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
-            logging.info(f"Server listening on {self.host}:{self.port}")
-            
-            self.client, self.addr = self.socket.accept()
-            logging.info(f"Connection from {self.addr}")
-            
-            self.handle_client()
-            
+            if uvloop is not None:
+                # libuv-based event loop, a drop-in replacement for asyncio's default
+                uvloop.run(self._serve())
+            else:
+                asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            pass
         except Exception as e:
             logging.error(f"Server error: {str(e)}")
         finally:
             self.cleanup()
 
-    def handle_client(self):
-        """Handle client commands"""
+    def _create_listen_socket(self):
+        """Create, tune and bind the listening socket"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Enable address reuse
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            # Let several server processes share the port; the kernel balances accepts.
+            # Off by default so a second server on a busy port fails with EADDRINUSE.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        # Buffer sizes must be set before listen() to apply to accepted connections
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        sock.bind((self.host, self.port))
+        return sock
+
+    async def _serve(self):
+        """Accept connections on the event loop, one task per client"""
+        self.socket = self._create_listen_socket()
+        server = await asyncio.start_server(self._on_client, sock=self.socket,
+                                            backlog=LISTEN_BACKLOG)
+        logging.info(f"Server listening on {self.host}:{self.port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self._sampler is not None:
+                self._sampler.cancel()
+
+    def _load_static_info(self):
+        """Collect values that never change for the lifetime of the process"""
+        import psutil
+        self._cpu_count_phys = psutil.cpu_count(logical=False)
+        self._cpu_count_log = psutil.cpu_count()
+        freq = psutil.cpu_freq()
+        self._cpu_freq_static = freq._asdict() if freq else {}
+        self._partitions = list(psutil.disk_partitions())
+        # On Linux, process memory is read straight from /proc; this converts
+        # resident pages to a percentage of physical memory
+        if sys.platform.startswith('linux'):
+            self._page_percent = os.sysconf('SC_PAGE_SIZE') * 100.0 / psutil.virtual_memory().total
+
+    def _refresh_metrics(self):
+        """Take a non-blocking sample of CPU, memory and network counters"""
+        import psutil
+        self._last_cpu = psutil.cpu_percent(interval=None, percpu=True)
+        self._last_cpu_freq = psutil.cpu_freq() if self._cpu_freq_static else None
+        self._last_memory = psutil.virtual_memory()
+        self._last_swap = psutil.swap_memory()
+        self._last_net = psutil.net_io_counters()
+
+    def _load_metrics(self):
+        """Import psutil and take the first samples; runs in the executor"""
+        self._load_static_info()
+        # The first cpu_percent() call only sets a baseline and reports meaningless
+        # values, so sample again one interval later before anything is served
+        self._refresh_metrics()
+        time.sleep(SAMPLE_INTERVAL)
+        self._refresh_metrics()
+
+    async def _init_once(self, name, func):
+        """Run a blocking initializer in the executor once; return an error response on failure"""
+        future = self._init_futures.get(name)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(None, func)
+            self._init_futures[name] = future
+        try:
+            # Shielded so a client disconnecting doesn't cancel it for everyone else
+            await asyncio.shield(future)
+        except Exception as e:
+            # Forget the failure so the next request retries
+            if self._init_futures.get(name) is future:
+                del self._init_futures[name]
+            logging.error(f"Error loading {name}: {str(e)}")
+            return f"Error loading {name}: {str(e)}"
+        return None
+
+    async def _sample_metrics(self):
+        """Keep the metric samples fresh so handlers never wait on psutil"""
+        while True:
+            await asyncio.sleep(SAMPLE_INTERVAL)
+            try:
+                self._refresh_metrics()
+            except Exception as e:
+                logging.error(f"Error sampling metrics: {str(e)}")
+
+    async def _on_client(self, reader, writer):
+        """Serve a single accepted connection until it closes"""
+        addr = writer.get_extra_info('peername')
+        self.configure_connection(writer.get_extra_info('socket'))
+        logging.info(f"Connection from {addr}")
+        try:
+            await self.handle_client(reader, writer)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+            logging.info(f"Connection from {addr} closed")
+
+    def configure_connection(self, conn):
+        """Tune an accepted client socket for small interactive exchanges"""
+        # Responses go out as one framed write; don't let Nagle hold them back
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Notice dead clients without waiting for the next command
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+
+    async def handle_client(self, reader, writer):
+        """Handle length-prefixed commands from one client"""
         while True:
             try:
-                data = self.client.recv(1024).decode()
-                if not data:
+                length = int.from_bytes(await reader.readexactly(HEADER_SIZE), 'little')
+                if length > MAX_COMMAND_SIZE:
+                    logging.error(f"Command of {length} bytes exceeds the size limit")
+                    break
+                cmd, args = self.parse_command(await reader.readexactly(length))
+                response = await self.process_command(cmd, args)
+                if isinstance(response, str):
+                    response = response.encode()
+                self.send_response(writer, response)
+                await writer.drain()
+                if cmd == b'exit':
                     break
                 
-                response = self.process_command(data)
-                self.client.send(response.encode())
-                
+            except asyncio.IncompleteReadError:
+                # Client closed the connection between (or in the middle of) commands
+                break
             except ConnectionResetError:
                 logging.error("Client disconnected unexpectedly")
                 break
@@ -95,148 +274,289 @@ class RemoteServer:
                 logging.error(f"Error handling client: {str(e)}")
                 break
 
-    def process_command(self, command):
-        """Process received commands and return appropriate response"""
-        command = command.strip().lower()
-        
-        # Extended dictionary of allowed commands
-        commands = {
-            'sysinfo': self.get_system_info,
-            'time': self.get_time,
-            'echo': self.echo_message,
-            'exit': self.exit_connection,
-            'cpu': self.get_cpu_info,
-            'memory': self.get_memory_info,
-            'processes': self.get_running_processes,
-            'netstat': self.get_network_stats,
-            'listdir': self.list_directory,
-            'diskspace': self.get_disk_space
-        }
-        
-        # Parse command and arguments
-        cmd_parts = command.split(' ', 1)
-        cmd = cmd_parts[0]
-        args = cmd_parts[1] if len(cmd_parts) > 1 else ''
+    def send_response(self, writer, payload):
+        """Queue a length-prefixed response; the transport writes both parts together"""
+        header = len(payload).to_bytes(HEADER_SIZE, 'little')
+        if payload is self._sysinfo_bytes and self._sysinfo_fd is not None:
+            writer.write(header)
+            self._sendfile_payload(writer, self._sysinfo_fd, payload)
+            return
+        writer.writelines((header, payload))
+
+    def _create_memfd(self, name, payload):
+        """Copy a cached response into an anonymous in-memory file for sendfile()"""
+        if len(payload) < SENDFILE_MIN_SIZE:
+            return None
+        if not hasattr(os, 'memfd_create') or not hasattr(os, 'sendfile'):
+            return None
+        try:
+            fd = os.memfd_create(name)
+            os.write(fd, payload)
+        except OSError:
+            return None
+        return fd
+
+    def _sendfile_payload(self, writer, fd, payload):
+        """Send a memfd-backed payload with sendfile(), avoiding a userspace copy"""
+        sent = 0
+        # Only safe once everything queued before it has reached the socket
+        if writer.transport.get_write_buffer_size() == 0:
+            sock = writer.get_extra_info('socket')
+            try:
+                sent = os.sendfile(sock.fileno(), fd, 0, len(payload))
+            except BlockingIOError:
+                pass
+        if sent < len(payload):
+            # Socket buffer is full; let the transport deliver the rest
+            writer.write(payload[sent:])
+
+    def parse_command(self, command):
+        """Split a raw command received as bytes into its command word and arguments"""
+        command = command.strip()
         
-        if cmd in commands:
-            return commands[cmd](args)
-        return "Invalid command. Use 'help' to see available commands."
+        # Parse command and arguments; only the command word is lowercased
+        sp = command.find(b' ')
+        if sp >= 0:
+            cmd = command[:sp].lower()
+            args = command[sp + 1:]
+        else:
+            cmd = command.lower()
+            args = b''
+        return cmd, args
 
-    def get_system_info(self, args):
-        """Return basic system information"""
+    async def process_command(self, cmd, args):
+        """Run a parsed command and return the appropriate response"""
+        handler = self._commands.get(cmd)
+        if handler is None:
+            return b"Invalid command. Use 'help' to see available commands."
+        if cmd in self._METRIC_COMMANDS and self._sampler is None:
+            error = await self._init_once('metrics', self._load_metrics)
+            if error:
+                return error
+            if self._sampler is None:
+                self._sampler = asyncio.create_task(self._sample_metrics())
+        elif cmd == b'sysinfo' and self._sysinfo_bytes is None:
+            # platform.processor() may spawn a subprocess; build the reply off the loop
+            error = await self._init_once('sysinfo', self._load_sysinfo)
+            if error:
+                return error
+        if cmd in self._INLINE_COMMANDS:
+            return handler(args)
+        # psutil and filesystem calls block; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, handler, args)
+
+    def _build_sysinfo_bytes(self):
+        """Render the sysinfo response once; platform details never change"""
+        import platform
         return f"""
 System Information:
 OS: {platform.system()} {platform.version()}
 Machine: {platform.machine()}
 Processor: {platform.processor()}
-"""
+""".encode()
+
+    def _load_sysinfo(self):
+        """Build the sysinfo reply and its memfd copy"""
+        sysinfo = self._build_sysinfo_bytes()
+        self._sysinfo_fd = self._create_memfd('sysinfo', sysinfo)
+        self._sysinfo_bytes = sysinfo
+
+    def get_system_info(self, args):
+        """Return basic system information"""
+        if self._sysinfo_bytes is None:
+            self._load_sysinfo()
+        return self._sysinfo_bytes
 
     def get_time(self, args):
         """Return current server time"""
+        from datetime import datetime
         return f"Server time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
     def echo_message(self, message):
         """Echo the received message"""
-        return f"Echo: {message}"
+        return b"Echo: " + message
 
     def exit_connection(self, args):
-        """Handle exit command"""
-        self.cleanup()
-        return "Server shutting down..."
+        """Handle exit command; the connection is closed once this is sent"""
+        return "Closing connection..."
 
     def cleanup(self):
         """Clean up server resources"""
-        if self.client:
-            self.client.close()
         if self.socket:
             self.socket.close()
+        if self._sysinfo_fd is not None:
+            os.close(self._sysinfo_fd)
+            self._sysinfo_fd = None
+        self._pool.shutdown(wait=False)
         logging.info("Server cleaned up and shut down")
 
+    def _dumps(self, obj):
+        """Serialize a response payload to indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
     def get_cpu_info(self, args):
         """Get detailed CPU information"""
+        cpu_freq = dict(self._cpu_freq_static)
+        if self._last_cpu_freq:
+            # Only the current frequency moves; min/max are fixed
+            cpu_freq['current'] = self._last_cpu_freq.current
         cpu_info = {
-            'cpu_percent': psutil.cpu_percent(interval=1, percpu=True),
-            'cpu_freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else {},
-            'cpu_count': psutil.cpu_count(logical=False),
-            'cpu_count_logical': psutil.cpu_count()
+            # Usage over the most recent sampling interval
+            'cpu_percent': self._last_cpu,
+            'cpu_freq': cpu_freq,
+            'cpu_count': self._cpu_count_phys,
+            'cpu_count_logical': self._cpu_count_log
         }
-        return json.dumps(cpu_info, indent=2)
+        return self._dumps(cpu_info)
 
     def get_memory_info(self, args):
         """Get system memory information"""
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+        memory = self._last_memory
+        swap = self._last_swap
+        # Raw byte counts; the client converts them to display units
         mem_info = {
-            'total': f"{memory.total / (1024**3):.2f} GB",
-            'available': f"{memory.available / (1024**3):.2f} GB",
-            'percent_used': f"{memory.percent}%",
-            'swap_total': f"{swap.total / (1024**3):.2f} GB",
-            'swap_used': f"{swap.used / (1024**3):.2f} GB"
+            'total': memory.total,
+            'available': memory.available,
+            'percent_used': memory.percent,
+            'swap_total': swap.total,
+            'swap_used': swap.used
         }
-        return json.dumps(mem_info, indent=2)
+        return self._dumps(mem_info)
+
+    def _iter_proc_rss(self):
+        """Yield (resident_pages, pid) for every process listed in /proc"""
+        with os.scandir('/proc') as it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/statm', 'rb') as f:
+                        rss = int(f.read().split()[1])
+                except (OSError, IndexError, ValueError):
+                    # Process exited while we were scanning
+                    continue
+                yield rss, int(entry.name)
+
+    def _extend_proc_name(self, pid, name):
+        """Recover a name the kernel cut to 15 characters from argv[0], as psutil does"""
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                argv0 = f.read().split(b'\0', 1)[0]
+        except OSError:
+            return name
+        extended = os.path.basename(argv0.decode(errors='replace'))
+        return extended if extended.startswith(name) else name
+
+    def _top_processes_proc(self):
+        """Top 10 processes by memory from /proc, without building psutil.Process objects"""
+        processes = []
+        for rss, pid in heapq.nlargest(10, self._iter_proc_rss()):
+            try:
+                with open(f'/proc/{pid}/comm', 'rb') as f:
+                    name = f.read().rstrip(b'\n').decode(errors='replace')
+            except OSError:
+                continue
+            if len(name) >= 15:
+                name = self._extend_proc_name(pid, name)
+            processes.append({
+                'pid': pid,
+                'name': name,
+                'memory_percent': rss * self._page_percent
+            })
+        return processes
 
     def get_running_processes(self, args):
         """Get list of running processes (top 10 by memory usage)"""
+        if self._page_percent is not None:
+            return self._dumps(self._top_processes_proc())
+        import psutil
         processes = []
-        for proc in sorted(psutil.process_iter(['pid', 'name', 'memory_percent']), 
-                          key=lambda x: x.info['memory_percent'] or 0, 
-                          reverse=True)[:10]:
+        for proc in heapq.nlargest(10, psutil.process_iter(['pid', 'name', 'memory_percent']),
+                                   key=lambda x: x.info['memory_percent'] or 0):
             try:
                 processes.append(proc.info)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-        return json.dumps(processes, indent=2)
+        return self._dumps(processes)
 
     def get_network_stats(self, args):
         """Get network statistics"""
-        net_stats = psutil.net_io_counters()
-        return json.dumps({
-            'bytes_sent': f"{net_stats.bytes_sent / (1024**2):.2f} MB",
-            'bytes_recv': f"{net_stats.bytes_recv / (1024**2):.2f} MB",
+        net_stats = self._last_net
+        return self._dumps({
+            'bytes_sent': net_stats.bytes_sent,
+            'bytes_recv': net_stats.bytes_recv,
             'packets_sent': net_stats.packets_sent,
             'packets_recv': net_stats.packets_recv
-        }, indent=2)
+        })
+
+    def _printable_name(self, name):
+        """Replace undecodable bytes in a filesystem name; orjson rejects surrogate escapes"""
+        return name.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
 
-    def list_directory(self, path=''):
+    def list_directory(self, path=b''):
         """List contents of allowed directories"""
         try:
             # Ensure the requested path is within allowed directories
-            requested_path = os.path.abspath(os.path.join('.', path.strip()))
-            if not any(requested_path.startswith(os.path.abspath(allowed)) 
-                      for allowed in self.allowed_dirs):
+            requested_path = os.path.abspath(os.path.join('.', path.decode().strip()))
+            if not (requested_path + os.sep).startswith(self._allowed_prefixes):
                 return "Access denied. Path not in allowed directories."
             
-            items = os.listdir(requested_path)
-            return json.dumps({
-                'path': requested_path,
+            with os.scandir(requested_path) as it:
+                items = [self._printable_name(entry.name) for entry in it]
+            return self._dumps({
+                'path': self._printable_name(requested_path),
                 'contents': items
-            }, indent=2)
+            })
         except Exception as e:
             return f"Error listing directory: {str(e)}"
 
     def get_disk_space(self, args):
         """Get disk space information"""
+        import psutil
         disk_info = {}
-        for partition in psutil.disk_partitions():
+        futures = {partition.mountpoint: self._pool.submit(psutil.disk_usage, partition.mountpoint)
+                   for partition in self._partitions}
+        for mountpoint, future in futures.items():
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_info[partition.mountpoint] = {
-                    'total': f"{usage.total / (1024**3):.2f} GB",
-                    'used': f"{usage.used / (1024**3):.2f} GB",
-                    'free': f"{usage.free / (1024**3):.2f} GB",
-                    'percent': f"{usage.percent}%"
+                usage = future.result()
+                disk_info[mountpoint] = {
+                    'total': usage.total,
+                    'used': usage.used,
+                    'free': usage.free,
+                    'percent': usage.percent
                 }
             except Exception:
                 continue
-        return json.dumps(disk_info, indent=2)
+        return self._dumps(disk_info)
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Remote Server')
     parser.add_argument('--host', default='127.0.0.1', help='Host to bind to')
     parser.add_argument('--port', type=int, default=65432, help='Port to bind to')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Server processes sharing the port via SO_REUSEPORT')
     return parser.parse_args()
 
+def run_server(host, port, reuse_port=False):
+    """Run a single server process"""
+    server = RemoteServer(host=host, port=port, reuse_port=reuse_port)
+    server.start_server()
+
 if __name__ == "__main__":
     args = parse_arguments()
-    server = RemoteServer(host=args.host, port=args.port)
-    server.start_server() 
\ No newline at end of file
+    workers = args.workers
+    if workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+        logging.warning("SO_REUSEPORT is not available; running a single server process")
+        workers = 1
+    if workers > 1:
+        # Every process binds the same port; the kernel spreads new connections across them
+        processes = [multiprocessing.Process(target=run_server,
+                                             args=(args.host, args.port, True))
+                     for _ in range(workers)]
+        for proc in processes:
+            proc.start()
+        for proc in processes:
+            proc.join()
+    else:
+        run_server(args.host, args.port) 
\ No newline at end of file